@@ -0,0 +1,96 @@
+"""
+Profiling harness for the query builders (`mosaicolabs.models.query.builders`).
+
+Query construction and serialization are pure Python dictionary manipulation:
+the cost is dominated by interpreter overhead (attribute lookups, method calls,
+transient allocations) rather than by arithmetic or memory bandwidth. This script
+runs a representative workload under `cProfile` and reports the per-function
+`tottime`, so that any change to the builders can be measured before and after.
+
+Run via:
+```bash
+cd mosaico-sdk-py && poetry run python bench/query_builders_bench.py
+```
+
+Options:
+    --queries N     number of QueryTopic/QuerySequence pairs built (default: 1000)
+    --keys K        metadata keys filtered by each query (default: 100)
+    --to-dict R     to_dict() calls per query, e.g. for retries/logging (default: 2)
+    --top T         number of functions reported (default: 25)
+    --output PATH   also dump the raw stats, for `snakeviz` or `pstats` browsing
+
+For a sampling profile without the cProfile instrumentation overhead:
+```bash
+py-spy record -o profile.svg -- python bench/query_builders_bench.py
+```
+"""
+
+import argparse
+import cProfile
+import pstats
+import time
+
+from mosaicolabs import IMU, QueryOntologyCatalog, QuerySequence, QueryTopic
+
+
+def run_workload(num_queries: int, num_keys: int, num_to_dict: int) -> int:
+    """
+    Builds `num_queries` topic and sequence queries with `num_keys` metadata
+    filters each, plus an ontology query, and serializes each of them
+    `num_to_dict` times.
+
+    Returns the total number of appended expressions.
+    """
+    num_exprs = 0
+    for i in range(num_queries):
+        qtopic = QueryTopic().with_name_match(f"camera_{i}")
+        qsequence = QuerySequence().with_name_match(f"run_{i}")
+        for k in range(num_keys):
+            qtopic.with_user_metadata(f"sensor.param_{k}", eq=k)
+            qsequence.with_user_metadata(f"environment.param_{k}", lt=k)
+
+        qcatalog = QueryOntologyCatalog(
+            IMU.Q.acceleration.x.gt(float(i)),
+            IMU.Q.acceleration.y.lt(float(i)),
+            include_timestamp_range=True,
+        )
+
+        for _ in range(num_to_dict):
+            qtopic.to_dict()
+            qsequence.to_dict()
+            qcatalog.to_dict()
+
+        num_exprs += 2 * (num_keys + 1) + 2
+    return num_exprs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--to-dict", type=int, default=2)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--output", type=str, default=None)
+    args = parser.parse_args()
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    num_exprs = run_workload(args.queries, args.keys, args.to_dict)
+    profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{num_exprs} expressions appended in {elapsed:.3f} s "
+        f"({1e6 * elapsed / num_exprs:.2f} us/expression, profiled)"
+    )
+
+    stats = pstats.Stats(profiler).strip_dirs().sort_stats("tottime")
+    stats.print_stats(args.top)
+    if args.output:
+        stats.dump_stats(args.output)
+        print(f"Raw stats written to '{args.output}'")
+
+
+if __name__ == "__main__":
+    main()
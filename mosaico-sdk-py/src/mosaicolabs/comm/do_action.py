@@ -13,7 +13,9 @@ providing stronger typing and validation than raw dictionaries.
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from enum import Enum
 from typing import Any, ClassVar, Dict, Optional, Type, TypeVar
+from uuid import UUID
 
 import pyarrow.flight as fl
 
@@ -23,6 +25,15 @@ from ..enum import FlightAction
 from ..logging_config import get_logger
 from ..models.query import QueryResponse, QueryResponseItem
 
+# 'orjson' is an optional accelerator for the action payloads serialization:
+# the stdlib 'json' module is used when it is not installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Set the hierarchical logger
 logger = get_logger(__name__)
 
@@ -87,6 +98,65 @@ class _DoActionResponse(ABC):
         pass
 
 
+# The values 'orjson' encodes differently from the stdlib 'json' module
+# (datetimes, dataclasses, subclasses of the builtin types) are passed through,
+# so that 'orjson' raises and the 'json' fallback handles them
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if ORJSON_AVAILABLE
+    else 0
+)
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Encodes the values 'orjson' always serializes natively and that cannot
+    be passed through, so that the stdlib 'json' module produces the same
+    document.
+    """
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _serialize_payload(payload: dict[str, Any]) -> bytes:
+    """
+    Serializes an action payload (e.g. the query dictionary) into the
+    UTF-8 JSON bytes sent as the Flight action body.
+
+    Uses 'orjson' when available, falling back to the stdlib 'json' module
+    whenever the two would not produce the same document: for the values
+    'orjson' cannot encode (e.g. integers beyond 64 bits, datetimes) and for
+    the bodies containing a `null`, which 'orjson' also writes for the
+    non-finite floats.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            body = orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson.JSONEncodeError is a TypeError subclass
+            pass
+        else:
+            if b"null" not in body:
+                return body
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
+def _deserialize_response(body: bytes) -> Any:
+    """
+    Parses the UTF-8 JSON bytes of a Flight action result.
+
+    Always uses the stdlib 'json' module: 'orjson' decodes the integers beyond
+    64 bits (e.g. large user metadata values) as floats, losing precision.
+    """
+    return json.loads(body.decode("utf-8"))
+
+
 def _do_action(
     client: fl.FlightClient,
     action: FlightAction,
@@ -116,7 +186,7 @@ def _do_action(
 
     try:
         # Serialize payload
-        body = json.dumps(payload).encode("utf-8")
+        body = _serialize_payload(payload)
         logger.debug(f"Action request body: '{body}'")
 
         # Execute Flight call
@@ -140,8 +210,7 @@ def _do_action(
         full_response_bytes = b"".join(chunks)
 
         # Decode and Parse exactly once
-        result_str = full_response_bytes.decode("utf-8")
-        result_dict: dict[str, Any] = json.loads(result_str)
+        result_dict: dict[str, Any] = _deserialize_response(full_response_bytes)
 
         # --- Validation ---
         # Verify the server is responding to the correct action
@@ -931,24 +931,13 @@ class MosaicoClient:
             ```
         """
         if queries:
-            self._queries = list(queries)
-            # Validate for duplicate query types to prevent overwrite logic errors
-            types_seen = {}
-            for q in queries:
-                t = type(q)
-                if t in types_seen:
-                    raise ValueError(
-                        f"Duplicate query type detected: '{t.__name__}'. "
-                        "Multiple instances of the same type will override each other when encoded.",
-                    )
-                else:
-                    types_seen[t] = True
-        elif query is not None:
-            self._queries = query._queries
-        else:
+            # 'Query' validates for duplicate query types to prevent overwrite logic errors
+            query = Query(*queries)
+        elif query is None:
             raise ValueError("Expected input queries or a 'Query' object")
+        self._queries = query._queries
 
-        query_dict: dict[str, Any] = {q.name(): q.to_dict() for q in self._queries}
+        query_dict: dict[str, Any] = query.to_dict()
 
         ACTION = FlightAction.QUERY
 
@@ -99,22 +99,15 @@ def unflatten_dict(d: dict[str, Any], sep: str = ".") -> dict[str, Any]:
     unflattened_dict = {}
 
     for compound_key, value in d.items():
-        # Decode value
-        value = decode_value(value)
+        # Split the compound key into the parent keys and the leaf key
+        *parent_keys, leaf_key = compound_key.split(sep)
 
-        # Split the compound key into individual keys
-        keys = compound_key.split(sep)
-
-        # Traverse the nested dict structure
+        # Walk (and create on the fly) the nested dict structure
         current_dict = unflattened_dict
-        for i, key in enumerate(keys):
-            is_last_key = i == len(keys) - 1
-            if is_last_key:
-                current_dict[key] = value
-            else:
-                if key not in current_dict:
-                    current_dict[key] = {}
-                current_dict = current_dict[key]
+        for key in parent_keys:
+            current_dict = current_dict.setdefault(key, {})
+
+        current_dict[leaf_key] = decode_value(value)
 
     return unflattened_dict
 
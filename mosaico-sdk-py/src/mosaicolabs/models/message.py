@@ -9,10 +9,23 @@ middleware-level metadata (like recording timestamp_ns).
 
 # --- Python Standard Library Imports ---
 from collections import defaultdict
-from typing import Any, Dict, Optional, Type, TypeVar
+from types import UnionType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 import pandas as pd
 import pyarrow as pa
+import pydantic
 from pydantic import PrivateAttr
 
 from ..helpers.helpers import encode_to_dict
@@ -32,6 +45,50 @@ def _make_schema(*args: pa.StructType) -> pa.Schema:
 
 TSerializable = TypeVar("TSerializable", bound="Serializable")
 
+# Annotations whose values are already wire-ready and need no encoding.
+_PASSTHROUGH_TYPES = (int, float, str, bool, bytes)
+
+_EncoderTable = Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+# Per-class encoder tables, keyed by (model class, skipped field)
+_ENCODER_TABLES: Dict[Tuple[type, Optional[str]], _EncoderTable] = {}
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _field_encoder(annotation: Any) -> Callable[[Any], Any]:
+    """
+    Resolves the encoder for a field from its type annotation.
+
+    Primitive fields (optionally wrapped in `Optional`) are returned unchanged,
+    all the others go through the generic `encode_to_dict` dispatch.
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    if annotation in _PASSTHROUGH_TYPES:
+        return _passthrough
+    return encode_to_dict
+
+
+def _get_encoder_table(
+    model_cls: Type[pydantic.BaseModel], skip: Optional[str] = None
+) -> _EncoderTable:
+    """Returns the `(field, encoder)` pairs of a model class, built on first use."""
+    key = (model_cls, skip)
+    table = _ENCODER_TABLES.get(key)
+    if table is None:
+        table = tuple(
+            (name, _field_encoder(finfo.annotation))
+            for name, finfo in model_cls.model_fields.items()
+            if name != skip
+        )
+        _ENCODER_TABLES[key] = table
+    return table
+
 
 class Message(BaseModel):
     """
@@ -353,15 +410,16 @@ class Message(BaseModel):
         """
         # Encode envelope fields
         columns_dict = {
-            field: encode_to_dict(getattr(self, field))
-            for field in self._self_model_keys
+            field: encode(getattr(self, field))
+            for field, encode in _get_encoder_table(type(self), skip="data")
         }
 
         # Encode and merge payload fields
+        data = self.data
         columns_dict.update(
             {
-                field: encode_to_dict(getattr(self.data, field))
-                for field in self._data_model_keys
+                field: encode(getattr(data, field))
+                for field, encode in _get_encoder_table(type(data))
             }
         )
 
@@ -18,7 +18,7 @@ from mosaicolabs.platform.resource_manifests import (
 from .session import Session
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Sequence:
     """
     Represents a read-only view of a server-side Sequence platform resource.
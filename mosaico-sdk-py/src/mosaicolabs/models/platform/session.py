@@ -14,7 +14,7 @@ from mosaicolabs.platform.resource_manifests import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Session:
     """
     Represents a read-only view of a server-side writing Session platform resource.
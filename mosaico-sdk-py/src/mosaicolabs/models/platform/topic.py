@@ -6,6 +6,7 @@ Topic's metadata in the platform catalog. It is used primarily for inspection
 (listing topics) and query construction.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
@@ -15,7 +16,7 @@ from mosaicolabs.platform.metadata import TopicMetadata
 from mosaicolabs.platform.resource_manifests import TopicResourceManifest
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Topic:
     """
     Represents a read-only view of a server-side Topic platform resource.
@@ -274,18 +275,19 @@ class Topic:
             raise ValueError(
                 "Metadata must be an instance of `mosaicolabs.comm.TopicMetadata`."
             )
-        user_metadata = getattr(platform_metadata, "user_metadata", None)
-        if user_metadata is None:
-            raise ValueError("Metadata must have a `user_metadata` attribute.")
+        # `TopicMetadata` is built (and validated) by the platform decoding layer:
+        # its fields are trusted and can be read directly.
+        properties = platform_metadata.properties
 
         return cls(
-            user_metadata=user_metadata,
+            user_metadata=platform_metadata.user_metadata,
             name=name,
             sequence_name=sequence_name,
             total_size_bytes=resrc_manifest.total_size_bytes,
             created_timestamp=resrc_manifest.created_timestamp,
-            ontology_tag=platform_metadata.properties.ontology_tag,
-            serialization_format=platform_metadata.properties.serialization_format.value,
+            # Tags come from a small vocabulary: share a single string object
+            ontology_tag=sys.intern(properties.ontology_tag),
+            serialization_format=properties.serialization_format.value,
             chunks_number=resrc_manifest.chunks_number,
             locked=resrc_manifest.locked,
         )
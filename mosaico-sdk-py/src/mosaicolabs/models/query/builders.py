@@ -12,7 +12,19 @@ It implements a Domain-Specific Language that allows users to filter **Sequences
 * [**`QuerySequence`**][mosaicolabs.models.query.builders.QuerySequence]: Specifically for filtering sequence-level metadata.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Type
+from collections import defaultdict
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 # Import custom types used in helper methods
 from mosaicolabs.types import Time
@@ -27,110 +39,254 @@ from .expressions import (
 from .generation.mixins import _make_queryable_field_intance, _QueryableDynamicValue
 from .protocols import QueryableProtocol
 
+# Fields of the platform views holding free-form dictionaries (like user_metadata):
+# expressions on these are nested under the field name when serialized
+_METADATA_FIELD_NAMES: FrozenSet[str] = frozenset({"user_metadata"})
+
 
 def _get_tag_from_expr_key(key: str):
-    fields = key.split(".")
-    if not len(fields) > 1:
+    # Only the first path segment is needed: stop at the first separator
+    tag, sep, _ = key.partition(".")
+    if not sep:
         raise ValueError(f"expected 'ontology_tag.field0.field1... in key, got '{key}'")
-    return fields[0]
+    return tag
 
 
-def _validate_expression_unique_key(
-    stored_exprs: List["_QueryExpression"], new_key: str
-):
-    """
-    Private helper to validate a single expression against the
-    class's key type.
+# --- Logical Combinators --
 
-    Raises a dynamic NotImplementedError if the key is already present.
+
+def _combine_expressions(expressions: List[_QueryExpression]) -> Dict[str, Any]:
     """
-    if any(e.key == new_key for e in stored_exprs):
-        raise NotImplementedError(
-            f"Query builder already contains the key '{new_key}'. The current implementation allows a key can appear only once per query."
-        )
+    Merges multiple `_QueryExpression` instances into a single cohesive query block.
 
+    The expressions are flattened into a single dictionary suitable for the Mosaico API.
+    Currently, all expressions combined in a single builder are treated with an
+    implicit **AND** logic.
 
-def _validate_expression_type(
-    expr: "_QueryExpression", expected_types: Tuple[Type[_QueryExpression], ...]
-):
+    Example:
+        `{"imu.acceleration.x": {"$gt": 5}, "imu.acceleration.y": {"$lt": 10}}`
     """
-    Private helper to validate a single expression against the
-    class's __supported_query_expressions__ type.
+    # Equivalent to merging the `expr.to_dict()` of each expression,
+    # without building the intermediate dictionaries
+    return {expr.key: {expr.op: expr.value} for expr in expressions}
 
-    Raises a dynamic TypeError if the type is incorrect.
-    """
-    # Get the type this class supports
 
-    if not isinstance(expr, expected_types):
-        # Dynamically get the names of the types for the error message
-        found_type = type(expr).__name__
-        expected_names = [expct.__name__ for expct in expected_types]
+# --- Query Builders --
+
 
-        raise TypeError(
-            f"Invalid expression type. Expected {expected_names}, but got '{found_type}'."
-        )
+# Used to preserve the concrete builder type through the fluent interface
+_QB = TypeVar("_QB", bound="_QueryBuilder")
 
 
-def _validate_expression_operator_format(expr: "_QueryExpression"):
+class _QueryBuilder:
     """
-    Private helper to validate a single expression against the
-    class's __supported_query_expressions__ type.
+    Shared state and validation of the expression-based query builders.
 
-    Raises a dynamic TypeError if the type is incorrect.
+    Stores the appended expressions, the set of their keys (used for duplicate
+    detection) and the cached result of `to_dict`, which is reset on every append.
     """
-    # Get the type this class supports
 
-    if not expr.op.startswith("$"):
-        raise ValueError(
-            f"Invalid expression operator '{expr.op}': must start with '$'."
-        )
+    __slots__ = ("_expressions", "_keys", "_dict_cache", "_frozen")
 
+    __supported_query_expressions__: Tuple[Type[_QueryExpression], ...] = ()
 
-# --- Logical Combinators --
+    def __init__(self):
+        self._expressions: List[_QueryExpression] = []
+        self._keys: Set[str] = set()
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        self._frozen = False
+
+    def freeze(self: _QB) -> _QB:
+        """
+        Marks the query as complete, preventing any further expression from being added.
+
+        A frozen query is serialized only once: every subsequent `to_dict()` call
+        returns a copy of the same cached dictionary.
+
+        Example:
+            ```python
+            query = QuerySequence().with_name_match("test_drive").freeze()
+
+            # Raises RuntimeError
+            query.with_user_metadata("project", eq="Apollo")
+            ```
+
+        Returns:
+            The query builder instance for method chaining.
+        """
+        self._frozen = True
+        return self
+
+    def _with_expression(self: _QB, expr: _QueryExpression) -> _QB:
+        """
+        Internal method for validating and adding a new expression to the query
+        inner list using a fluent interface.
+
+        Args:
+            expr: An expression of one of the `__supported_query_expressions__` types.
+
+        Returns:
+            The query builder instance for method chaining.
+
+        Raises:
+            TypeError: If the expression is not of the supported type.
+            ValueError: If the operator does not start with the required '$' prefix.
+            NotImplementedError: If the key (field path) is already in the query.
+            RuntimeError: If the query has been frozen via `freeze()`.
+        """
+        if self._frozen:
+            raise RuntimeError(
+                f"'{type(self).__name__}' is frozen: no expression can be added."
+            )
+        self._validate(expr)
+
+        self._expressions.append(expr)
+        self._keys.add(expr.key)
+        self._dict_cache = None
+        return self
+
+    def _unsafe_extend(self: _QB, exprs: List[_QueryExpression]) -> _QB:
+        """
+        Internal method for bulk-adding expressions **without validation**.
+
+        Reserved to trusted internal call sites building expressions that are
+        valid by construction (e.g. `QueryResponse.to_query_sequence`): it must
+        never be exposed to user-provided expressions.
+
+        Args:
+            exprs: A list of expressions of one of the `__supported_query_expressions__` types.
+
+        Returns:
+            The query builder instance for method chaining.
+
+        Raises:
+            RuntimeError: If the query has been frozen via `freeze()`.
+        """
+        if self._frozen:
+            raise RuntimeError(
+                f"'{type(self).__name__}' is frozen: no expression can be added."
+            )
+        self._expressions.extend(exprs)
+        self._keys.update(expr.key for expr in exprs)
+        self._dict_cache = None
+        return self
+
+    def _validate(self, expr: _QueryExpression):
+        """
+        Private helper to validate a single expression against the builder's
+        supported expression types, the operator format and the stored keys.
+
+        The error messages are only built on failure.
+        """
+        expected_types = type(self).__supported_query_expressions__
+        if not isinstance(expr, expected_types):
+            # Dynamically get the names of the types for the error message
+            found_type = type(expr).__name__
+            expected_names = [expct.__name__ for expct in expected_types]
+            raise TypeError(
+                f"Invalid expression type. Expected {expected_names}, but got '{found_type}'."
+            )
+
+        op = expr.op
+        if not op or op[0] != "$":
+            raise ValueError(
+                f"Invalid expression operator '{op}': must start with '$'."
+            )
+
+        key = expr.key
+        if key in self._keys:
+            raise NotImplementedError(
+                f"Query builder already contains the key '{key}'. The current implementation allows a key can appear only once per query."
+            )
 
 
-class _QueryCombinator:
+class _QueryPlatformBuilder(_QueryBuilder):
     """
-    Merges multiple `_QueryExpression` instances into a single cohesive query block.
+    Base of the query builders for the platform entities (Topics and Sequences).
 
-    The combinator is responsible for flattening individual expressions into a
-    single dictionary suitable for the Mosaico API. Currently,
-    all expressions combined in a single builder are treated with an implicit **AND** logic.
+    Implements the serialization shared by these builders, which nests the
+    expressions on dictionary fields (like `user_metadata`) under the field name.
     """
 
-    def __init__(
-        self,
-        expressions: List[_QueryExpression],
-        # op: str = "$and",
-    ):
+    __slots__ = ()
+
+    @classmethod
+    def _from_expressions(cls: Type[_QB], *exprs: _QueryExpression) -> _QB:
         """
-        Initializes the logical combinator.
+        Internal method for creating a new query builder from a list of expressions.
 
         Args:
-            expressions: A list of atomic expressions to merge.
+            exprs: A list of expressions of the builder's supported type.
+
+        Returns:
+            A new query builder instance containing the provided expressions.
         """
-        # self.op = op
-        self.expressions = expressions
+        instance = cls()
+        for expr in exprs:
+            instance._with_expression(expr)
+        return instance
 
+    # compatibility with QueryProtocol
     def to_dict(self) -> Dict[str, Any]:
         """
-        Converts the logical group into a merged dictionary format.
+        Serializes the query into a nested dictionary for the platform API.
 
-        Example:
-            `{"imu.acceleration.x": {"$gt": 5}, "imu.acceleration.y": {"$lt": 10}}`
+        This method partitions expressions into two groups:
+
+        1. **System Fields**: Standard fields like `name` are kept in the root dictionary.
+        2. **Metadata Fields**: Fields starting with a dictionary-type model key (e.g., `user_metadata`)
+           are stripped of their prefix and nested under that key.
+
+        Returns:
+            A dictionary representation of the query, e.g., `{"locator": {"$eq": "..."}, "user_metadata": {"key": {"$eq": "..."}}}`.
+            The nested dictionaries are shared with the cached serialization and must not be mutated.
         """
-        if not self.expressions:
-            return {}
-        # return {self.op: [expr.to_dict() for expr in self.expressions]}
-        return {
-            key: val for expr in self.expressions for key, val in expr.to_dict().items()
-        }
 
+        # The builders are append-only: reuse the last serialization until
+        # a new expression invalidates it. A shallow copy is returned, so that
+        # the caller cannot alter the cached dictionary
+        if self._dict_cache is not None:
+            return dict(self._dict_cache)
 
-# --- Query Builders --
+        # The stripped expressions keep the expression type of the builder
+        expression_type = self.__supported_query_expressions__[0]
+
+        # Partition all expressions into "normal" or "metadata"
+        normal_exprs = []
+        # Buckets are only created for the metadata fields actually used
+        # (e.g., {"user_metadata": [...]})
+        metadata_buckets: DefaultDict[str, List[_QueryExpression]] = defaultdict(list)
+
+        for expr in self._expressions:
+            # Split the field path once: e.g., "user_metadata.mission" gives
+            # the metadata field name "user_metadata" and the sub-key "mission"
+            head, sep, sub_key = expr.key.partition(".")
+            if head not in _METADATA_FIELD_NAMES:
+                normal_exprs.append(expr)
+            elif sep:
+                # Re-create the expression with the prefix stripped
+                metadata_buckets[head].append(
+                    expression_type(sub_key, expr.op, expr.value)
+                )
+            # else: skip expressions on the root dict itself (e.g., user_metadata.is_null())
 
+        # Combine the normal, top-level expressions
+        # This will produce {"locator": {"$eq": "..."}}
+        exprs_dict = _combine_expressions(normal_exprs)
 
-class QueryOntologyCatalog:
+        # Build and merge the nested metadata dictionaries
+        for meta_name, stripped_exprs in metadata_buckets.items():
+            # Combine the new, stripped expressions into a dict
+            meta_dict = _combine_expressions(stripped_exprs)
+            # Add them nested under the metadata field name
+            # e.g., exprs_dict["user_metadata"] = {"mission": {"$eq": "..."}}
+            exprs_dict[meta_name] = meta_dict
+
+        self._dict_cache = exprs_dict
+        return dict(exprs_dict)
+
+
+class QueryOntologyCatalog(_QueryBuilder):
     """
     A top-level query object for the Data Catalog that combines multiple sensor-field expressions.
 
@@ -184,6 +340,8 @@ class QueryOntologyCatalog:
         _QueryCatalogExpression,
     )
 
+    __slots__ = ("_include_tstamp_range",)
+
     def __init__(
         self,
         *expressions: "_QueryExpression",
@@ -204,14 +362,11 @@ class QueryOntologyCatalog:
             ValueError: If an operator does not start with the required '$' prefix.
             NotImplementedError: If a duplicate key (field path) is detected within the same query.
         """
-        self._expressions = []
+        super().__init__()
         self._include_tstamp_range = include_timestamp_range
         # Call the helper for each expression
         for expr in expressions:
-            _validate_expression_type(expr, self.__supported_query_expressions__)
-            _validate_expression_operator_format(expr)
-            _validate_expression_unique_key(self._expressions, expr.key)
-            self._expressions.append(expr)
+            self._with_expression(expr)
 
     @classmethod
     def _from_expressions(cls, *exprs: _QueryExpression) -> "QueryOntologyCatalog":
@@ -274,15 +429,7 @@ class QueryOntologyCatalog:
         Returns:
             The `QueryOntologyCatalog` instance for method chaining.
         """
-        _validate_expression_type(
-            expr,
-            self.__supported_query_expressions__,
-        )
-        _validate_expression_operator_format(expr)
-        _validate_expression_unique_key(self._expressions, expr.key)
-
-        self._expressions.append(expr)
-        return self
+        return self._with_expression(expr)
 
     # compatibility with QueryProtocol
     def name(self) -> str:
@@ -299,14 +446,22 @@ class QueryOntologyCatalog:
 
         Returns:
             A dictionary containing all merged sensor-field expressions.
+            The nested dictionaries are shared with the cached serialization and must not be mutated.
         """
-        query_dict = _QueryCombinator(list(self._expressions)).to_dict()
+        # The builders are append-only: reuse the last serialization until
+        # a new expression invalidates it. A shallow copy is returned, so that
+        # the caller cannot alter the cached dictionary
+        if self._dict_cache is not None:
+            return dict(self._dict_cache)
+
+        query_dict = _combine_expressions(self._expressions)
         if self._include_tstamp_range:
             query_dict.update({"include_timestamp_range": self._include_tstamp_range})
-        return query_dict
+        self._dict_cache = query_dict
+        return dict(query_dict)
 
 
-class QueryTopic:
+class QueryTopic(_QueryPlatformBuilder):
     """
     A top-level query object for Topic data that combines multiple expressions with a logical AND.
 
@@ -340,50 +495,7 @@ class QueryTopic:
         _QueryTopicExpression,
     )
 
-    def __init__(self):
-        """
-        The constructor initializes an empty query builder
-        """
-        self._expressions = []
-
-    @classmethod
-    def _from_expressions(cls, *exprs: _QueryExpression) -> "QueryTopic":
-        """
-        Internal method for creating a new query builder from a list of expressions.
-
-        Args:
-            exprs: A list of `_QueryTopicExpression` instances.
-
-        Returns:
-            A new `QueryTopic` instance containing the provided expressions.
-        """
-        instance = cls()
-
-        for expr in exprs:
-            _validate_expression_type(expr, cls.__supported_query_expressions__)
-            _validate_expression_operator_format(expr)
-            _validate_expression_unique_key(instance._expressions, expr.key)
-            instance._expressions.append(expr)
-
-        return instance
-
-    def _with_expression(self, expr: _QueryExpression) -> "QueryTopic":
-        """
-        Internal method for adding a new expression to the query inner list
-        using a fluent interface.
-
-        Args:
-            expr: A `_QueryTopicExpression`.
-
-        Returns:
-            The `QueryTopic` instance for method chaining.
-        """
-
-        _validate_expression_type(expr, self.__supported_query_expressions__)
-        _validate_expression_operator_format(expr)
-        _validate_expression_unique_key(self._expressions, expr.key)
-        self._expressions.append(expr)
-        return self
+    __slots__ = ()
 
     # --- Helper methods for common fields ---
 
@@ -614,79 +726,8 @@ class QueryTopic:
         """Returns the top-level key ('topic') used when nesting this query inside a root [`Query`][mosaicolabs.models.query.builders.Query]."""
         return "topic"
 
-    # compatibility with QueryProtocol
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Serializes the query into a nested dictionary for the platform API.
-
-        This method partitions expressions into two groups:
-
-        1. **System Fields**: Standard fields like `name` are kept in the root dictionary.
-        2. **Metadata Fields**: Fields starting with a dictionary-type model key (e.g., `user_metadata`)
-           are stripped of their prefix and nested under that key.
-
-        Returns:
-            A dictionary representation of the query, e.g., `{"locator": {"$eq": "..."}, "user_metadata": {"key": {"$eq": "..."}}}`.
-        """
-
-        # Set all fields that are dictionaries (like user_metadata)
-        metadata_field_names = {
-            "user_metadata",
-        }
 
-        # Partition all expressions into "normal" or "metadata"
-        normal_exprs = []
-        # Create a "bucket" for each metadata field (e.g., {"user_metadata": []})
-        metadata_buckets = {name: [] for name in metadata_field_names}
-
-        for expr in self._expressions:
-            is_metadata_expr = False
-            for meta_name in metadata_field_names:
-                # Check if the expression's field path starts with a metadata field name
-                # e.g., "user_metadata.mission" starts with "user_metadata"
-                if expr.key == meta_name or expr.key.startswith(f"{meta_name}."):
-                    metadata_buckets[meta_name].append(expr)
-                    is_metadata_expr = True
-                    break
-
-            if not is_metadata_expr:
-                normal_exprs.append(expr)
-
-        # Combine the normal, top-level expressions
-        # This will produce {"locator": {"$eq": "..."}}
-        exprs_dict = _QueryCombinator(normal_exprs).to_dict()
-
-        # Build and merge the nested metadata dictionaries
-        for meta_name, meta_exprs in metadata_buckets.items():
-            if not meta_exprs:
-                continue  # Skip if no expressions for this metadata field
-
-            # Re-create expressions with the prefix stripped
-            # e.g., "user_metadata.mission" -> "mission"
-            stripped_exprs = []
-            for expr in meta_exprs:
-                if "." not in expr.key:
-                    # Skip expressions on the root dict itself (e.g., user_metadata.is_null())
-                    continue
-
-                # Get the sub-key (e.g., "mission")
-                sub_key = expr.key.split(".", 1)[1]
-                # Create a new expression with the sub-key as its path
-                stripped_exprs.append(
-                    _QueryTopicExpression(sub_key, expr.op, expr.value)
-                )
-
-            if stripped_exprs:
-                # Combine the new, stripped expressions into a dict
-                meta_dict = _QueryCombinator(stripped_exprs).to_dict()
-                # Add them nested under the metadata field name
-                # e.g., exprs_dict["user_metadata"] = {"mission": {"$eq": "..."}}
-                exprs_dict[meta_name] = meta_dict
-
-        return exprs_dict
-
-
-class QuerySequence:
+class QuerySequence(_QueryPlatformBuilder):
     """
     A top-level query object for Sequence data that combines multiple expressions with a logical AND.
 
@@ -717,51 +758,7 @@ class QuerySequence:
         _QuerySequenceExpression,
     )
 
-    def __init__(self):
-        """
-        The constructor initializes an empty query builder
-        """
-        self._expressions = []
-
-    @classmethod
-    def _from_expressions(cls, *exprs: _QueryExpression) -> "QuerySequence":
-        """
-        Internal method for creating a new query builder from a list of expressions.
-
-        Args:
-            exprs: A list of `_QuerySequenceExpression` instances.
-
-        Returns:
-            A new `QuerySequence` instance containing the provided expressions.
-        """
-        instance = cls()
-
-        for expr in exprs:
-            _validate_expression_type(expr, cls.__supported_query_expressions__)
-            _validate_expression_operator_format(expr)
-            _validate_expression_unique_key(instance._expressions, expr.key)
-            instance._expressions.append(expr)
-
-        return instance
-
-    def _with_expression(self, expr: _QueryExpression) -> "QuerySequence":
-        """
-        Internal method for adding a new expression to the query inner list
-        using a fluent interface.
-
-        Args:
-            expr: A `_QuerySequenceExpression`.
-
-        Returns:
-            The `QuerySequence` instance for method chaining.
-
-        """
-        _validate_expression_type(expr, self.__supported_query_expressions__)
-        _validate_expression_operator_format(expr)
-        _validate_expression_unique_key(self._expressions, expr.key)
-
-        self._expressions.append(expr)
-        return self
+    __slots__ = ()
 
     def with_user_metadata(self, key: str, **operator_kwargs: Any) -> "QuerySequence":
         """
@@ -952,76 +949,6 @@ class QuerySequence:
         """Returns the top-level key ('sequence') used for nesting inside a root [`Query`][mosaicolabs.models.query.builders.Query]."""
         return "sequence"
 
-        # compatibility with QueryProtocol
-
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Serializes the query into a nested dictionary for the platform API.
-
-        This method partitions expressions into:
-
-        1. **Normal Fields**: Fields like `name` are kept in a flat dictionary.
-        2. **Metadata Fields**: Fields targeting `user_metadata` are collected and nested.
-
-        Returns:
-            A dictionary representation preserving the hierarchical structure.
-        """
-        # Identify all fields that are dictionaries (like user_metadata)
-        metadata_field_names = {
-            "user_metadata",
-        }
-
-        # Partition all expressions into "normal" or "metadata"
-        normal_exprs = []
-        # Create a "bucket" for each metadata field (e.g., {"user_metadata": []})
-        metadata_buckets = {name: [] for name in metadata_field_names}
-
-        for expr in self._expressions:
-            is_metadata_expr = False
-            for meta_name in metadata_field_names:
-                # Check if the expression's field path starts with a metadata field name
-                # e.g., "user_metadata.mission" starts with "user_metadata"
-                if expr.key == meta_name or expr.key.startswith(f"{meta_name}."):
-                    metadata_buckets[meta_name].append(expr)
-                    is_metadata_expr = True
-                    break
-
-            if not is_metadata_expr:
-                normal_exprs.append(expr)
-
-        # Combine the normal, top-level expressions
-        # This will produce {"locator": {"$eq": "..."}}
-        exprs_dict = _QueryCombinator(normal_exprs).to_dict()
-
-        # Build and merge the nested metadata dictionaries
-        for meta_name, meta_exprs in metadata_buckets.items():
-            if not meta_exprs:
-                continue  # Skip if no expressions for this metadata field
-
-            # Re-create expressions with the prefix stripped
-            # e.g., "user_metadata.mission" -> "mission"
-            stripped_exprs = []
-            for expr in meta_exprs:
-                if "." not in expr.key:
-                    # Skip expressions on the root dict itself (e.g., user_metadata.is_null())
-                    continue
-
-                # Get the sub-key (e.g., "mission")
-                sub_key = expr.key.split(".", 1)[1]
-                # Create a new expression with the sub-key as its path
-                stripped_exprs.append(
-                    _QuerySequenceExpression(sub_key, expr.op, expr.value)
-                )
-
-            if stripped_exprs:
-                # Combine the new, stripped expressions into a dict
-                meta_dict = _QueryCombinator(stripped_exprs).to_dict()
-                # Add them nested under the metadata field name
-                # e.g., exprs_dict["user_metadata"] = {"mission": {"$eq": "..."}}
-                exprs_dict[meta_name] = meta_dict
-
-        return exprs_dict
-
 
 class Query:
     """
@@ -1060,6 +987,8 @@ class Query:
         ```
     """
 
+    __slots__ = ("_queries", "_types_seen")
+
     def __init__(self, *queries: QueryableProtocol):
         """
         Initializes the root query with a set of sub-queries.
@@ -1070,21 +999,10 @@ class Query:
         Raises:
             ValueError: If duplicate query types are detected in the initial arguments.
         """
-        self._queries = list(queries)
-
-        # --- Validation ---
-        # Check for duplicate query types (e.g., two QueryTopic instances)
-        # as they would overwrite each other in the final dictionary.
-        self._types_seen = {}
-        for q in queries:
-            t = type(q)
-            if t in self._types_seen:
-                raise ValueError(
-                    f"Duplicate query type detected: '{t.__name__}'. "
-                    "Multiple instances of the same type will override each other when encoded.",
-                )
-            else:
-                self._types_seen[t] = True
+        self._queries: List[QueryableProtocol] = []
+        self._types_seen: Set[type] = set()
+        # The duplicate query types validation is performed by 'append'
+        self.append(*queries)
 
     def append(self, *queries: QueryableProtocol):
         """
@@ -1116,16 +1034,23 @@ class Query:
             )
             ```
         """
+        # --- Validation ---
+        # Check for duplicate query types (e.g., two QueryTopic instances)
+        # as they would overwrite each other in the final dictionary.
+        types_seen = self._types_seen
+        new_types: Set[type] = set()
         for q in queries:
             t = type(q)
-            if t in self._types_seen:
+            if t in types_seen or t in new_types:
                 raise ValueError(
                     f"Duplicate query type detected: '{t.__name__}'. "
                     "Multiple instances of the same type will override each other when encoded.",
                 )
-            else:
-                self._types_seen[t] = True
-                self._queries.append(q)
+            new_types.add(t)
+        # All the queries are valid: add them in one go, so that a failed
+        # append leaves the query unchanged
+        types_seen.update(new_types)
+        self._queries.extend(queries)
 
     def to_dict(self) -> Dict[str, Any]:
         """
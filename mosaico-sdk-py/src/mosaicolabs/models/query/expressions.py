@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Dict
 
 
@@ -16,8 +17,9 @@ class _QueryExpression:
         a [`_QueryCatalogExpression`][mosaicolabs.models.query.expressions._QueryCatalogExpression] (a subclass of this class).
     2.  **Validation**: A [Builder][mosaicolabs.models.query.builders] receives the expression
         and validates its type, operator format, and key uniqueness.
-    3.  **Serialization**: The builder calls `.to_dict()` on the expression to
-        transform it into the specific JSON format expected by the platform.
+    3.  **Serialization**: The builder reads the `key`, `op` and `value` of the
+        expression to write it into the specific JSON format expected by the platform,
+        the same produced by the expression `.to_dict()`.
 
     Attributes:
         full_path: The complete, dot-separated path to the target field on the platform.
@@ -37,7 +39,9 @@ class _QueryExpression:
         # self.key is the full path used in the final query dict, e.g., "GPS.status"
         self.key = full_path
 
-        self.op = op
+        # Operators are a small closed set used as dict keys in the serialized
+        # query: interning lets them share a single cached-hash instance
+        self.op = sys.intern(op)
         self.value = value
 
     def to_dict(self) -> Dict[str, Any]:
@@ -43,6 +43,8 @@ class _QueryProxy:
         # and prevent recursion loops.
         self.__path__ = full_path
         self.__map__ = field_map
+        # Nested proxies, built on first access and then reused
+        self.__proxies__: Dict[str, "_QueryProxy"] = {}
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -71,11 +73,16 @@ class _QueryProxy:
 
         if isinstance(child, dict):
             # This is a nested struct (e.g., 'position').
-            # Return a *new* QueryProxy instance for this deeper path.
-            return _QueryProxy(
-                full_path=f"{self.__path__}.{name}",  # e.g., "gps.position"
-                field_map=child,  # The nested field map
-            )
+            # Return the QueryProxy instance for this deeper path,
+            # creating it only the first time it is requested.
+            proxy = self.__proxies__.get(name)
+            if proxy is None:
+                proxy = _QueryProxy(
+                    full_path=f"{self.__path__}.{name}",  # e.g., "gps.position"
+                    field_map=child,  # The nested field map
+                )
+                self.__proxies__[name] = proxy
+            return proxy
         else:
             # This is a simple field (a _QueryableField instance).
             # Return it directly.
@@ -1,6 +1,6 @@
 import datetime
 import inspect
-from typing import Any, Tuple, Type, Union
+from typing import Any, Dict, Tuple, Type, Union
 
 from ..expressions import _QueryExpression
 
@@ -298,17 +298,10 @@ class _DynamicFieldFactoryMixin:
         # e.g., "user_metadata.mission"
         new_path = f"{self.full_path}.{key}"
 
-        # Create a dynamic class that has all queryable behaviors.
+        # Get the dynamic class that has all queryable behaviors.
         # A value in a Dict[str, Any] could be anything, so we
-        # provide all operator sets.
-        _QueryableDynamicValueField = type(
-            "_QueryableDynamicValueField",
-            (
-                _QueryableDynamicValue,  # "do-it-all" mixin
-                _QueryableField,  # Base implementation
-            ),
-            {},
-        )
+        # provide all operator sets ("do-it-all" mixin).
+        _QueryableDynamicValueField = _make_queryable_field_type(_QueryableDynamicValue)
 
         # Return an instance of this new dynamic field
         return _QueryableDynamicValueField(full_path=new_path, expr_cls=self._expr_cls)
@@ -484,12 +477,24 @@ class _QueryableField:
         )
 
 
+# Cache of the composite (mixin + _QueryableField) classes, one per mixin.
+# The composite classes are stateless, so they can be shared by all the fields
+# (and all the models) using the same mixin.
+_QUERYABLE_FIELD_TYPES: Dict[Type, Type] = {}
+
+
 def _make_queryable_field_type(MixinType: Type) -> Type:
-    return type(f"{MixinType.__name__}Field", (MixinType, _QueryableField), {})
+    field_type = _QUERYABLE_FIELD_TYPES.get(MixinType)
+    if field_type is None:
+        field_type = type(
+            f"{MixinType.__name__}Field", (MixinType, _QueryableField), {}
+        )
+        _QUERYABLE_FIELD_TYPES[MixinType] = field_type
+    return field_type
 
 
 def _make_queryable_field_intance(
     queryable_type: Type, field_full_path: str, expression_type: Type[_QueryExpression]
 ) -> Any:
-    cls = type(f"{queryable_type.__name__}Field", (queryable_type, _QueryableField), {})
+    cls = _make_queryable_field_type(queryable_type)
     return cls(full_path=field_full_path, expr_cls=expression_type)
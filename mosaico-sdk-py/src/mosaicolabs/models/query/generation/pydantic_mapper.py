@@ -15,7 +15,7 @@ import pydantic
 from ..expressions import _QueryExpression
 from .internal import _PYTHON_TYPE_TO_QUERYABLE
 from .mixins import (
-    _QueryableField,
+    _make_queryable_field_type,
     _QueryableUnsupported,
 )
 
@@ -151,7 +151,7 @@ class PydanticFieldMapper:
                 #     )
                 # else:
                 #     q_cls = type(f"{mixin.__name__}Field", (mixin, _QueryableField), {})
-                q_cls = type(f"{mixin.__name__}Field", (mixin, _QueryableField), {})
+                q_cls = _make_queryable_field_type(mixin)
 
                 # Instantiate it with its full query path
                 field_map[field_name] = q_cls(
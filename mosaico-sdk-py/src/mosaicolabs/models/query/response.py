@@ -1,11 +1,38 @@
 from dataclasses import dataclass, field
-from typing import Any, Iterator, List, Optional
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Optional
 
 from mosaicolabs.helpers import unpack_topic_full_path
 
 from .builders import QuerySequence, QueryTopic
 from .expressions import _QuerySequenceExpression, _QueryTopicExpression
 
+# Topic names resolved from the response locators. The same locators show up
+# across repeated or chained queries: resolve each of them once. The cache is
+# bounded by being reset when full.
+_TOPIC_NAMES_CACHE: Dict[str, str] = {}
+_TOPIC_NAMES_CACHE_MAX_SIZE = 16384
+
+
+def _topic_name_from_locator(locator: str) -> str:
+    tname = _TOPIC_NAMES_CACHE.get(locator)
+    if tname is None:
+        seq_topic_tuple = unpack_topic_full_path(locator)
+        if not seq_topic_tuple:
+            raise ValueError(f"Invalid topic name in response '{locator}'")
+        if len(_TOPIC_NAMES_CACHE) >= _TOPIC_NAMES_CACHE_MAX_SIZE:
+            _TOPIC_NAMES_CACHE.clear()
+        _, tname = seq_topic_tuple
+        _TOPIC_NAMES_CACHE[locator] = tname
+    return tname
+
+
+# Name extraction from the response items runs in C via map/chain
+_get_sequence_name = attrgetter("sequence.name")
+_get_topics = attrgetter("topics")
+_get_name = attrgetter("name")
+
 
 @dataclass
 class TimestampRange:
@@ -24,7 +51,7 @@ class TimestampRange:
     end: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QueryResponseItemSequence:
     """
     Metadata container for a single sequence discovered during a query.
@@ -40,7 +67,7 @@ class QueryResponseItemSequence:
         return cls(name=qdict["sequence"])
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QueryResponseItemTopic:
     """
     Metadata for a specific topic (sensor stream) within a sequence.
@@ -59,10 +86,7 @@ class QueryResponseItemTopic:
 
     @classmethod
     def _from_dict(cls, tdict: dict[str, Any]) -> "QueryResponseItemTopic":
-        seq_topic_tuple = unpack_topic_full_path(tdict["locator"])
-        if not seq_topic_tuple:
-            raise ValueError(f"Invalid topic name in response '{tdict['locator']}'")
-        _, tname = seq_topic_tuple
+        tname = _topic_name_from_locator(tdict["locator"])
         tsrange = tdict.get("timestamp_range")
 
         return cls(
@@ -73,7 +97,7 @@ class QueryResponseItemTopic:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QueryResponseItem:
     """
     A unified result item representing a sequence and its associated topics.
@@ -94,9 +118,7 @@ class QueryResponseItem:
     def _from_dict(cls, qdict: dict[str, Any]) -> "QueryResponseItem":
         return cls(
             sequence=QueryResponseItemSequence._from_dict(qdict),
-            topics=[
-                QueryResponseItemTopic._from_dict(tdict) for tdict in qdict["topics"]
-            ],
+            topics=list(map(QueryResponseItemTopic._from_dict, qdict["topics"])),
         )
 
 
@@ -184,12 +206,15 @@ class QueryResponse:
             raise ValueError(
                 "Cannot create a 'QuerySequence' builder from an empty response"
             )
-        return QuerySequence._from_expressions(
-            _QuerySequenceExpression(
-                full_path="locator",
-                op="$in",
-                value=[it.sequence.name for it in self.items],
-            )
+        # The '$in' expression is valid by construction: skip the builder validation
+        return QuerySequence()._unsafe_extend(
+            [
+                _QuerySequenceExpression(
+                    full_path="locator",
+                    op="$in",
+                    value=list(map(_get_sequence_name, self.items)),
+                )
+            ]
         )
 
     def to_query_topic(self) -> QueryTopic:
@@ -229,12 +254,20 @@ class QueryResponse:
             raise ValueError(
                 "Cannot create a 'QueryTopic' builder from an empty response"
             )
-        return QueryTopic._from_expressions(
-            _QueryTopicExpression(
-                "locator",
-                "$in",
-                [t.name for it in self.items for t in it.topics],
-            )
+        # The '$in' expression is valid by construction: skip the builder validation
+        return QueryTopic()._unsafe_extend(
+            [
+                _QueryTopicExpression(
+                    "locator",
+                    "$in",
+                    list(
+                        map(
+                            _get_name,
+                            chain.from_iterable(map(_get_topics, self.items)),
+                        )
+                    ),
+                )
+            ]
         )
 
     def __len__(self) -> int:
@@ -251,4 +284,4 @@ class QueryResponse:
 
     def is_empty(self) -> bool:
         """Returns True if the response contains no results."""
-        return len(self.items) == 0
+        return not self.items
@@ -6,12 +6,22 @@ Defines the data structure for temperature sensors.
 
 from typing import Optional
 
+import numpy as np
+import pyarrow as pa
+from numpy.typing import ArrayLike
+
 from mosaicolabs.models import MosaicoType
 from mosaicolabs.models.types import MosaicoField
 
 from ..mixins import VarianceMixin
 from ..serializable import Serializable
 
+# Conversion constants to Kelvin. The Fahrenheit conversion
+# `(F - 32) * 5 / 9 + 273.15` is folded into a single scale and offset
+_CELSIUS_TO_KELVIN_OFFSET = 273.15
+_FAHRENHEIT_TO_KELVIN_SCALE = 5.0 / 9.0
+_FAHRENHEIT_TO_KELVIN_OFFSET = _CELSIUS_TO_KELVIN_OFFSET - 32.0 * 5.0 / 9.0
+
 
 class Temperature(Serializable, VarianceMixin):
     """
@@ -162,6 +172,45 @@ class Temperature(Serializable, VarianceMixin):
             variance_type=variance_type,
         )
 
+    @classmethod
+    def from_celsius_array(cls, values: ArrayLike) -> pa.Array:
+        """
+        Converts a batch of temperature values in Celsius into a PyArrow array of
+        values in Kelvin, e.g. for building the `value` column of many samples at once.
+
+        The conversion runs vectorized over the whole batch, instead of creating a
+        `Temperature` instance per sample via [`from_celsius`][mosaicolabs.models.sensors.Temperature.from_celsius].
+
+        Args:
+            values (ArrayLike): The temperature values in Celsius.
+
+        Returns:
+            pa.Array: A `float64` array with the values in Kelvin.
+        """
+        kelvin = np.asarray(values, dtype=np.float64) + _CELSIUS_TO_KELVIN_OFFSET
+        return pa.array(kelvin, type=pa.float64())
+
+    @classmethod
+    def from_fahrenheit_array(cls, values: ArrayLike) -> pa.Array:
+        """
+        Converts a batch of temperature values in Fahrenheit into a PyArrow array of
+        values in Kelvin, e.g. for building the `value` column of many samples at once.
+
+        The conversion runs vectorized over the whole batch, instead of creating a
+        `Temperature` instance per sample via [`from_fahrenheit`][mosaicolabs.models.sensors.Temperature.from_fahrenheit].
+        Results may differ from the scalar conversion in the last floating-point digit.
+
+        Args:
+            values (ArrayLike): The temperature values in Fahrenheit.
+
+        Returns:
+            pa.Array: A `float64` array with the values in Kelvin.
+        """
+        kelvin = np.asarray(values, dtype=np.float64) * _FAHRENHEIT_TO_KELVIN_SCALE
+        # In-place: no further temporary array
+        kelvin += _FAHRENHEIT_TO_KELVIN_OFFSET
+        return pa.array(kelvin, type=pa.float64())
+
     def to_celsius(self) -> float:
         """
         Converts and returns the `Temperature` value in Celsius using the formula
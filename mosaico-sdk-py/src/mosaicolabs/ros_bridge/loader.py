@@ -1,7 +1,7 @@
 import fnmatch
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Tuple, Union
+from typing import Dict, Generator, List, Mapping, Optional, Tuple, Union
 
 from rosbags.highlevel import AnyReader
 from rosbags.interfaces import Connection, TopicInfo
@@ -233,7 +233,7 @@ class ROSLoader:
                 f"Unsupported format '{self._file_path.suffix}'. Supported: {self.ACCEPTED_EXTENSIONS}"
             )
 
-    def _register_definitions(self, types_map: Dict[str, str]):
+    def _register_definitions(self, types_map: Mapping[str, str]):
         """Safe registration wrapper."""
         from rosbags.typesys import get_types_from_msg
 
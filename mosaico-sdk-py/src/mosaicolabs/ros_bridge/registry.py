@@ -16,9 +16,11 @@ When a `ROSDataLoader` is initialized, it requests a merged view of the Global +
 definitions relevant to its specific data file.
 """
 
-from collections import defaultdict
+import os
+import sys
 from pathlib import Path
-from typing import Dict, Optional, Union
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Union
 
 from rosbags.typesys import Stores
 
@@ -27,6 +29,34 @@ from ..logging_config import get_logger
 # Set the hierarchical logger
 logger = get_logger(__name__)
 
+# Contents of the already read '.msg' files.
+# Key: (absolute path, modification time in ns, size, inode): an edited or
+# replaced file is read again, even within the same modification time tick.
+# The cache is bounded by being reset when full.
+_MSG_FILES_CACHE: Dict[Tuple[str, int, int, int], str] = {}
+_MSG_FILES_CACHE_MAX_SIZE = 1024
+
+
+def _read_msg_file(path: Path) -> str:
+    """
+    Reads the content of a `.msg` file, reusing the cached one if the file
+    has not been modified since the last read.
+
+    Raises:
+        FileNotFoundError: If `path` does not exist.
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    cache_key = (abs_path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    definition = _MSG_FILES_CACHE.get(cache_key)
+    if definition is None:
+        with open(abs_path, encoding="utf-8") as f:
+            definition = f.read()
+        if len(_MSG_FILES_CACHE) >= _MSG_FILES_CACHE_MAX_SIZE:
+            _MSG_FILES_CACHE.clear()
+        _MSG_FILES_CACHE[cache_key] = definition
+    return definition
+
 
 class ROSTypeRegistry:
     """
@@ -51,7 +81,29 @@ class ROSTypeRegistry:
     # Internal storage.
     # Key: Store Name (e.g. "GLOBAL", "ros2_foxy")
     # Value: Dict[MsgType, Definition]
-    _registry: Dict[str, Dict[str, str]] = defaultdict(dict)
+    # Scopes are created on their first registration.
+    _registry: Dict[str, Dict[str, str]] = {}
+
+    # Merged (GLOBAL + Scoped) views returned by 'get_types', built once per store.
+    # Key: Store Name (as in '_registry')
+    # Invalidated by 'register' and 'reset'.
+    # The views are read-only, to be safely shared among the loaders.
+    _merged_cache: Dict[str, Mapping[str, str]] = {}
+
+    # Registry keys of the already seen stores.
+    # Key: Store (enum or string), Value: Store Name (interned)
+    _key_cache: Dict[Union[Stores, str], str] = {}
+
+    # Canonical instance of each registered definition: identical definitions
+    # registered in several scopes share the same string.
+    _canonical_defs: Dict[str, str] = {}
+
+    # Number of registry entries referencing each canonical definition: a
+    # definition is evicted once all the types using it are registered again.
+    _canonical_refs: Dict[str, int] = {}
+
+    # Shared default for the scopes without definitions, on the read paths
+    _EMPTY: Mapping[str, str] = MappingProxyType({})
 
     @classmethod
     def register(
@@ -97,14 +149,17 @@ class ROSTypeRegistry:
             definition = cls._resolve_source(source)
 
             # Determine the registry key (Profile)
-            # Convert enum to string if necessary to ensure consistent keys
-            key = str(store) if store else "GLOBAL"
+            key = cls._key_of(store)
 
             # Store definition
             # Overwrites existing definition if the same type is registered twice in the same scope
-            cls._registry[key][msg_type] = definition
+            cls._store_definition(
+                cls._registry.setdefault(key, {}), msg_type, definition
+            )
+            cls._merged_cache.clear()
 
-            logger.debug(f"Registered custom type '{msg_type}' for scope: '{key}'")
+            # Lazy formatting: 'register' may be called in bulk with DEBUG disabled
+            logger.debug("Registered custom type '%s' for scope: '%s'", msg_type, key)
 
         except Exception as e:
             logger.error(f"Failed to register type '{msg_type}': '{e}'")
@@ -146,22 +201,78 @@ class ROSTypeRegistry:
         if not path.is_dir():
             raise ValueError(f"Path '{path}' is not a directory.")
 
-        logger.debug(f"Scanning directory '{path}' for .msg files...")
-        count = 0
+        logger.debug("Scanning directory '%s' for .msg files...", path)
+        batch: Dict[str, str] = {}
+
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".msg") or not entry.is_file():
+                    continue
+                # Construct standard ROS type name convention
+                # filename "MyData.msg" -> type "MyData"
+                type_name = f"{package_name}/msg/{name[:-4]}"
+
+                try:
+                    batch[type_name] = _read_msg_file(Path(entry.path))
+                except Exception as e:
+                    logger.error(f"Failed to register type '{type_name}': '{e}'")
+                    raise
+
+        if not batch:
+            logger.warning(f"No .msg files found in '{path}'.")
+            return
 
-        for msg_file in path.glob("*.msg"):
-            # Construct standard ROS type name convention
-            # filename "MyData.msg" -> type "MyData"
-            type_name = f"{package_name}/msg/{msg_file.stem}"
+        # All the files were read: register them in one go
+        cls._bulk_register(batch, store=store)
 
-            cls.register(type_name, msg_file, store=store)
-            count += 1
+    @classmethod
+    def _bulk_register(
+        cls,
+        definitions: Dict[str, str],
+        store: Optional[Union[Stores, str]] = None,
+    ):
+        """
+        Registers several already resolved definitions into the `store` scope.
 
-        if count == 0:
-            logger.warning(f"No .msg files found in '{path}'.")
+        Args:
+            definitions: The raw definition strings, by message type.
+            store: The target scope. If `None`, the definitions are stored in the
+                **GLOBAL** profile.
+        """
+        key = cls._key_of(store)
+        scope = cls._registry.setdefault(key, {})
+        for msg_type, definition in definitions.items():
+            cls._store_definition(scope, msg_type, definition)
+        cls._merged_cache.clear()
+
+        logger.debug(
+            "Registered %d custom types for scope: '%s'", len(definitions), key
+        )
 
     @classmethod
-    def get_types(cls, store: Optional[Union[Stores, str]]) -> Dict[str, str]:
+    def _store_definition(cls, scope: Dict[str, str], msg_type: str, definition: str):
+        """
+        Stores the canonical instance of `definition` as the `msg_type` one in
+        `scope`, evicting the replaced definition if no longer referenced.
+        """
+        definition = cls._canonical_defs.setdefault(definition, definition)
+        cls._canonical_refs[definition] = cls._canonical_refs.get(definition, 0) + 1
+
+        replaced = scope.get(msg_type)
+        scope[msg_type] = definition
+        if replaced is None:
+            return
+
+        refs = cls._canonical_refs[replaced] - 1
+        if refs:
+            cls._canonical_refs[replaced] = refs
+        else:
+            del cls._canonical_refs[replaced]
+            del cls._canonical_defs[replaced]
+
+    @classmethod
+    def get_types(cls, store: Optional[Union[Stores, str]]) -> Mapping[str, str]:
         """
         Retrieves a merged view of message definitions for a specific distribution.
 
@@ -177,23 +288,37 @@ class ROSTypeRegistry:
             store: The distribution identifier (e.g., `Stores.ROS2_HUMBLE`) to fetch overrides for.
 
         Returns:
-            A flat dictionary mapping `msg_type` to `definition`, formatted for
-            direct injection into `rosbags` high-level readers.
+            A flat, read-only mapping of `msg_type` to `definition`, formatted for
+            direct injection into `rosbags` high-level readers. The mapping is
+            cached and shared until the next `register` or `reset`: use `dict(...)`
+            to get a mutable copy.
         """
-        # Start with Global defaults
-        # We use .copy() to ensure we don't accidentally mutate the registry itself
-        merged = cls._registry["GLOBAL"].copy()
-
-        if store:
-            store_key = str(store)
-            # Override
-            if store_key in cls._registry:
-                specific_types = cls._registry[store_key]
-                # Update merges keys, overwriting globals if duplicates exist
-                merged.update(specific_types)
+        key = cls._key_of(store)
+        merged = cls._merged_cache.get(key)
+        if merged is None:
+            merged = MappingProxyType(cls._build_merged(key))
+            cls._merged_cache[key] = merged
 
         return merged
 
+    @classmethod
+    def _build_merged(cls, key: str) -> Dict[str, str]:
+        """
+        Builds the merged view of the GLOBAL definitions overlaid with the ones
+        of the `key` scope.
+        """
+        # Start with Global defaults
+        # Read through .get(), not to insert empty scopes in the registry
+        global_types = cls._registry.get("GLOBAL", cls._EMPTY)
+        scoped_types = cls._registry.get(key) if key != "GLOBAL" else None
+        if not scoped_types:
+            # We copy to ensure we don't accidentally mutate the registry itself
+            return dict(global_types)
+
+        # Override: the merged dict is built in a single pass,
+        # overwriting globals if duplicates exist
+        return {**global_types, **scoped_types}
+
     @classmethod
     def reset(cls):
         """
@@ -203,6 +328,25 @@ class ROSTypeRegistry:
         total isolation between different test cases.
         """
         cls._registry.clear()
+        cls._merged_cache.clear()
+        cls._canonical_defs.clear()
+        cls._canonical_refs.clear()
+        _MSG_FILES_CACHE.clear()
+
+    @classmethod
+    def _key_of(cls, store: Optional[Union[Stores, str]]) -> str:
+        """
+        Returns the registry key (Profile) of `store`: "GLOBAL" if not set.
+
+        Enums are converted to string to ensure consistent keys; the conversion
+        is made once per store, and the key is interned.
+        """
+        if not store:
+            return "GLOBAL"
+        key = cls._key_cache.get(store)
+        if key is None:
+            key = cls._key_cache.setdefault(store, sys.intern(str(store)))
+        return key
 
     @staticmethod
     def _resolve_source(source: Union[str, Path]) -> str:
@@ -217,20 +361,24 @@ class ROSTypeRegistry:
             The raw text content of the ROS message definition.
         """
         if isinstance(source, Path):
-            if not source.exists():
+            try:
+                return _read_msg_file(source)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Msg file not found: '{source}'")
-            return source.read_text(encoding="utf-8")
         elif isinstance(source, str):
             # Heuristic check: is this a path string or a definition?
             # If it looks like a path and exists, treat as file.
             # Otherwise treat as raw definition.
             # (Note: This is a design choice; explicit Path objects are safer).
-            possible_path = Path(source)
+            # Definitions never end with '.msg' and are usually multi-line:
+            # they are returned without probing the filesystem.
+            if "\n" in source or not source.endswith(".msg"):
+                return source
+
             try:
-                if possible_path.exists() and possible_path.suffix == ".msg":
-                    return possible_path.read_text(encoding="utf-8")
+                return _read_msg_file(Path(source))
             except OSError:
-                pass  # Filename too long or invalid, treat as definition string
+                pass  # Missing, too long or invalid filename, treat as definition string
 
             return source
         else:
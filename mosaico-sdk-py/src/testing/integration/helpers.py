@@ -1,6 +1,6 @@
 import itertools
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable, List
 
 from mosaicolabs.models import Message, Serializable
@@ -36,6 +36,11 @@ class SequenceDataStream:
     tstamp_ns_end: int
     dt_nanosec: int
     items: List[DataStreamItem]
+    # Sorted timestamps of 'items', for bisecting the time-windowed streams
+    timestamps_ns: List[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.timestamps_ns = [it.msg.timestamp_ns for it in self.items]
 
 
 def make_imu_front_msg(meas_time: Time):
@@ -1,5 +1,5 @@
 import bisect
-from typing import Optional
+from typing import Callable, Optional
 
 import pytest
 
@@ -35,16 +35,12 @@ def _exec_test_sequence_data_stream_timerange(
     assert next_tstamp is not None
     # assert the valid behavior of next_timestamp(): does not consume anything
     assert next_tstamp == sstream_handl.next_timestamp()
-    assert sstream_handl.next_timestamp() == sstream_handl.next_timestamp()
 
     # find the index to start from (which corresponds to timestamp_ns_start)
     msg_idx_start = (
         0
         if time_start is None
-        else bisect.bisect_left(
-            [it.msg.timestamp_ns for it in _make_sequence_data_stream.items],
-            time_start,
-        )
+        else bisect.bisect_left(_make_sequence_data_stream.timestamps_ns, time_start)
     )
     msg_count = msg_idx_start
 
@@ -53,11 +49,7 @@ def _exec_test_sequence_data_stream_timerange(
         len(_make_sequence_data_stream.items) - 1
         if time_end is None
         else (
-            bisect.bisect_left(
-                [it.msg.timestamp_ns for it in _make_sequence_data_stream.items],
-                time_end,
-            )
-            - 1
+            bisect.bisect_left(_make_sequence_data_stream.timestamps_ns, time_end) - 1
         )
     )
 
@@ -105,6 +97,7 @@ def _exec_test_topic_data_stream_timerange(
         for dstream in _make_sequence_data_stream.items
         if dstream.topic == topic
     ]
+    _cached_topic_timestamps = [it.msg.timestamp_ns for it in _cached_topic_data_stream]
     seqhandler = _client.sequence_handler(UPLOADED_SEQUENCE_NAME)
     # just prevent IDE to complain about None
     assert seqhandler is not None
@@ -117,10 +110,7 @@ def _exec_test_topic_data_stream_timerange(
     msg_idx_start = (
         0
         if time_start is None
-        else bisect.bisect_left(
-            [it.msg.timestamp_ns for it in _cached_topic_data_stream],
-            time_start,
-        )
+        else bisect.bisect_left(_cached_topic_timestamps, time_start)
     )
     msg_count = msg_idx_start
 
@@ -128,13 +118,7 @@ def _exec_test_topic_data_stream_timerange(
     msg_idx_stop = (
         len(_cached_topic_data_stream) - 1
         if time_end is None
-        else (
-            bisect.bisect_left(
-                [it.msg.timestamp_ns for it in _cached_topic_data_stream],
-                time_end,
-            )
-            - 1
-        )
+        else (bisect.bisect_left(_cached_topic_timestamps, time_end) - 1)
     )
 
     # This must raise if topic handler is malformed
@@ -150,7 +134,6 @@ def _exec_test_topic_data_stream_timerange(
     assert next_tstamp is not None
     # assert the valid behavior of next_timestamp(): does not consume anything
     assert next_tstamp == tstream_handl.next_timestamp()
-    assert tstream_handl.next_timestamp() == tstream_handl.next_timestamp()
 
     # Start consuming data stream
     for message in tstream_handl:
@@ -180,219 +163,87 @@ def _exec_test_topic_data_stream_timerange(
     _client.close()
 
 
-def test_sequence_data_stream_timerange_from_start_to_end(
-    mosaico_client: MosaicoClient,
-    synthetic_sequence_data_stream: SequenceDataStream,  # Get the data stream for comparisons
-    inject_synthetic_sequence,  # Make sure data are available on the server
-):
-    """Test that the sequence time-windowed data stream from start to end is correctly unpacked and provided"""
-    _exec_test_sequence_data_stream_timerange(
-        mosaico_client,
-        synthetic_sequence_data_stream,
-        synthetic_sequence_data_stream.tstamp_ns_start,
-        synthetic_sequence_data_stream.tstamp_ns_end,
-    )
-
-
-def test_sequence_data_stream_timerange_from_half_to_end(
-    mosaico_client: MosaicoClient,
-    synthetic_sequence_data_stream: SequenceDataStream,  # Get the data stream for comparisons
-    inject_synthetic_sequence,  # Make sure data are available on the server
-):
-    """Test retrieving the data-stream from half of the sequence, with full range in flight info command"""
-    # start from the half of the sequence
-    timestamp_ns_start = synthetic_sequence_data_stream.tstamp_ns_start + int(
-        (
-            synthetic_sequence_data_stream.tstamp_ns_end
-            - synthetic_sequence_data_stream.tstamp_ns_start
-        )
-        / 2
-    )
-    timestamp_ns_end = synthetic_sequence_data_stream.tstamp_ns_end
-
-    _exec_test_sequence_data_stream_timerange(
-        mosaico_client,
-        synthetic_sequence_data_stream,
-        timestamp_ns_start,
-        timestamp_ns_end,
-    )
-
+def _start(stream: SequenceDataStream) -> int:
+    """First timestamp of the sequence"""
+    return stream.tstamp_ns_start
 
-def test_sequence_data_stream_timerange_from_half(
-    mosaico_client: MosaicoClient,
-    synthetic_sequence_data_stream: SequenceDataStream,  # Get the data stream for comparisons
-    inject_synthetic_sequence,  # Make sure data are available on the server
-):
-    """Test retrieving the data-stream from half of the sequence, with partial range in flight info command"""
-    # start from the half of the sequence
-    timestamp_ns_start = synthetic_sequence_data_stream.tstamp_ns_start + int(
-        (
-            synthetic_sequence_data_stream.tstamp_ns_end
-            - synthetic_sequence_data_stream.tstamp_ns_start
-        )
-        / 2
-    )
-    _exec_test_sequence_data_stream_timerange(
-        mosaico_client,
-        synthetic_sequence_data_stream,
-        timestamp_ns_start,
-        None,
-    )
 
+def _end(stream: SequenceDataStream) -> int:
+    """Last timestamp of the sequence"""
+    return stream.tstamp_ns_end
 
-def test_sequence_data_stream_timerange_from_start_to_half(
-    mosaico_client: MosaicoClient,
-    synthetic_sequence_data_stream: SequenceDataStream,  # Get the data stream for comparisons
-    inject_synthetic_sequence,  # Make sure data are available on the server
-):
-    """Test retrieving the data-stream to half of the sequence, with full range in flight info command"""
-    # start from the half of the sequence
-    timestamp_ns_start = synthetic_sequence_data_stream.tstamp_ns_start
-    timestamp_ns_end = synthetic_sequence_data_stream.tstamp_ns_start + int(
-        (
-            synthetic_sequence_data_stream.tstamp_ns_start
-            + synthetic_sequence_data_stream.tstamp_ns_end
-        )
-        / 2
-    )
 
-    _exec_test_sequence_data_stream_timerange(
-        mosaico_client,
-        synthetic_sequence_data_stream,
-        timestamp_ns_start,
-        timestamp_ns_end,
+def _half(stream: SequenceDataStream) -> int:
+    """Timestamp at the half of the sequence"""
+    return stream.tstamp_ns_start + int(
+        (stream.tstamp_ns_end - stream.tstamp_ns_start) / 2
     )
 
 
-def test_sequence_data_stream_timerange_to_half(
-    mosaico_client: MosaicoClient,
-    synthetic_sequence_data_stream: SequenceDataStream,  # Get the data stream for comparisons
-    inject_synthetic_sequence,  # Make sure data are available on the server
-):
-    """Test retrieving the data-stream to half of the sequence, with partial range in flight info command"""
-    # start from the half of the sequence
-    timestamp_ns_end = synthetic_sequence_data_stream.tstamp_ns_start + int(
-        (
-            synthetic_sequence_data_stream.tstamp_ns_start
-            + synthetic_sequence_data_stream.tstamp_ns_end
-        )
-        / 2
-    )
-
-    _exec_test_sequence_data_stream_timerange(
-        mosaico_client,
-        synthetic_sequence_data_stream,
-        None,
-        timestamp_ns_end,
+def _half_end(stream: SequenceDataStream) -> int:
+    """End bound of the 'to half' windows, as computed by the original tests"""
+    # Note: this bound lies past the end of the sequence
+    return stream.tstamp_ns_start + int(
+        (stream.tstamp_ns_start + stream.tstamp_ns_end) / 2
     )
 
 
-# Repeat for each topic
-@pytest.mark.parametrize("topic", topic_list)
-def test_topic_data_stream_from_half_to_end(
-    mosaico_client: MosaicoClient,
-    synthetic_sequence_data_stream: SequenceDataStream,  # Get the data stream for comparisons
-    inject_synthetic_sequence,  # Make sure data are available on the server
-    topic: str,
-):
-    """Test retrieving each topic data-stream from half of the sequence, with full range in flight info command"""
-    # start from the half of the sequence
-    timestamp_ns_start = synthetic_sequence_data_stream.tstamp_ns_start + int(
-        (
-            synthetic_sequence_data_stream.tstamp_ns_end
-            - synthetic_sequence_data_stream.tstamp_ns_start
-        )
-        / 2
-    )
-    timestamp_ns_end = synthetic_sequence_data_stream.tstamp_ns_end
+# Time windows bounds: 'None' leaves the bound unset,
+# i.e. the full range is used in the flight info command
+_TIMERANGE_BOUNDS = [
+    pytest.param(_start, _end, id="from_start_to_end"),
+    pytest.param(_half, _end, id="from_half_to_end"),
+    pytest.param(_half, None, id="from_half"),
+    pytest.param(_start, _half_end, id="from_start_to_half"),
+    pytest.param(None, _half_end, id="to_half"),
+]
 
-    _exec_test_topic_data_stream_timerange(
-        mosaico_client,
-        synthetic_sequence_data_stream,
-        topic,
-        timestamp_ns_start,
-        timestamp_ns_end,
-    )
+# The topic data streams are not tested on the full sequence window
+_TOPIC_TIMERANGE_BOUNDS = _TIMERANGE_BOUNDS[1:]
 
+_BoundFn = Optional[Callable[[SequenceDataStream], int]]
 
-# Repeat for each topic
-@pytest.mark.parametrize("topic", topic_list)
-def test_topic_data_stream_from_half(
-    mosaico_client: MosaicoClient,
-    synthetic_sequence_data_stream: SequenceDataStream,  # Get the data stream for comparisons
-    inject_synthetic_sequence,  # Make sure data are available on the server
-    topic: str,
-):
-    """Test retrieving each topic data-stream from half of the sequence, with partial range in flight info command"""
-    # start from the half of the sequence
-    timestamp_ns_start = synthetic_sequence_data_stream.tstamp_ns_start + int(
-        (
-            synthetic_sequence_data_stream.tstamp_ns_end
-            - synthetic_sequence_data_stream.tstamp_ns_start
-        )
-        / 2
-    )
 
-    _exec_test_topic_data_stream_timerange(
-        mosaico_client,
-        synthetic_sequence_data_stream,
-        topic,
-        timestamp_ns_start,
-        None,
-    )
+def _timestamp_at(
+    _make_sequence_data_stream: SequenceDataStream, bound: _BoundFn
+) -> Optional[int]:
+    """Returns the timestamp of 'bound' in the sequence, if set"""
+    return None if bound is None else bound(_make_sequence_data_stream)
 
 
-# Repeat for each topic
-@pytest.mark.parametrize("topic", topic_list)
-def test_topic_data_stream_from_start_to_half(
+@pytest.mark.parametrize("start_bound, end_bound", _TIMERANGE_BOUNDS)
+def test_sequence_data_stream_timerange(
     mosaico_client: MosaicoClient,
     synthetic_sequence_data_stream: SequenceDataStream,  # Get the data stream for comparisons
     inject_synthetic_sequence,  # Make sure data are available on the server
-    topic: str,
+    start_bound: _BoundFn,
+    end_bound: _BoundFn,
 ):
-    """Test retrieving each topic data-stream up to half of the sequence, with full range in flight info command"""
-    # start from the beginning of the sequence
-    timestamp_ns_start = synthetic_sequence_data_stream.tstamp_ns_start
-    # stop at the half of the sequence
-    timestamp_ns_end = synthetic_sequence_data_stream.tstamp_ns_start + int(
-        (
-            synthetic_sequence_data_stream.tstamp_ns_start
-            + synthetic_sequence_data_stream.tstamp_ns_end
-        )
-        / 2
-    )
-
-    _exec_test_topic_data_stream_timerange(
+    """Test that the sequence time-windowed data stream is correctly unpacked and provided"""
+    _exec_test_sequence_data_stream_timerange(
         mosaico_client,
         synthetic_sequence_data_stream,
-        topic,
-        timestamp_ns_start,
-        timestamp_ns_end,
+        _timestamp_at(synthetic_sequence_data_stream, start_bound),
+        _timestamp_at(synthetic_sequence_data_stream, end_bound),
     )
 
 
 # Repeat for each topic
+@pytest.mark.parametrize("start_bound, end_bound", _TOPIC_TIMERANGE_BOUNDS)
 @pytest.mark.parametrize("topic", topic_list)
-def test_topic_data_stream_to_half(
+def test_topic_data_stream_timerange(
     mosaico_client: MosaicoClient,
     synthetic_sequence_data_stream: SequenceDataStream,  # Get the data stream for comparisons
     inject_synthetic_sequence,  # Make sure data are available on the server
     topic: str,
+    start_bound: _BoundFn,
+    end_bound: _BoundFn,
 ):
-    """Test retrieving each topic data-stream up to half of the sequence, with partial range in flight info command"""
-    # stop at the half of the sequence
-    timestamp_ns_end = synthetic_sequence_data_stream.tstamp_ns_start + int(
-        (
-            synthetic_sequence_data_stream.tstamp_ns_start
-            + synthetic_sequence_data_stream.tstamp_ns_end
-        )
-        / 2
-    )
-
+    """Test retrieving each topic time-windowed data-stream"""
     _exec_test_topic_data_stream_timerange(
         mosaico_client,
         synthetic_sequence_data_stream,
         topic,
-        None,
-        timestamp_ns_end,
+        _timestamp_at(synthetic_sequence_data_stream, start_bound),
+        _timestamp_at(synthetic_sequence_data_stream, end_bound),
     )
@@ -0,0 +1,118 @@
+import json
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+import pytest
+
+from mosaicolabs import IMU
+from mosaicolabs.comm import do_action
+from mosaicolabs.comm.do_action import (
+    _deserialize_response,
+    _DoActionQueryResponse,
+    _serialize_payload,
+)
+from mosaicolabs.models.query import (
+    Query,
+    QueryOntologyCatalog,
+    QuerySequence,
+    TimestampRange,
+)
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+class _Color(Enum):
+    RED = 1
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def orjson_available(request, monkeypatch) -> bool:
+    """Runs the test with and without the 'orjson' serializer"""
+    if request.param and not do_action.ORJSON_AVAILABLE:
+        pytest.skip("'orjson' is not installed")
+    monkeypatch.setattr(do_action, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+def test_query_payload_serialization(orjson_available: bool):
+    """The query action body decodes back to the query dictionary"""
+    query = Query(
+        QuerySequence().with_name_match("test_drive").with_user_metadata("id", eq=1),
+        QueryOntologyCatalog(
+            IMU.Q.acceleration.x.gt(5.0), include_timestamp_range=True
+        ),
+    )
+    body = _serialize_payload(query.to_dict())
+    assert isinstance(body, bytes)
+    assert json.loads(body) == query.to_dict()
+
+
+def test_action_payload_codec(orjson_available: bool):
+    """The action payloads round-trip exactly, with and without 'orjson'"""
+    payload = {
+        "name": "seq_1",
+        "timestamp_range": [1700000000000000000, 1700000000500000000],
+        "values": [0.5, None, True],
+        "u64_max": 2**64 - 1,
+        "i64_min": -(2**63),
+        "beyond_u64": 2**64,
+        "beyond_i64": -(2**63) - 1,
+        "big": 123456789012345678901234567890,
+    }
+    body = _serialize_payload(payload)
+    assert isinstance(body, bytes)
+
+    decoded = _deserialize_response(body)
+    assert decoded == payload
+    assert all(
+        isinstance(decoded[k], int)
+        for k in ("u64_max", "i64_min", "beyond_u64", "beyond_i64", "big")
+    )
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_action_payload_non_finite_floats(orjson_available: bool, value: float):
+    """The non-finite floats are encoded as by the stdlib 'json' module"""
+    assert _serialize_payload({"key": value}) == json.dumps({"key": value}).encode()
+
+
+@pytest.mark.parametrize("value", [datetime(2026, 1, 1), _Point(x=1)])
+def test_action_payload_unsupported_values(orjson_available: bool, value):
+    """The values rejected by the stdlib 'json' module are always rejected"""
+    with pytest.raises(TypeError):
+        _serialize_payload({"key": value})
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (UUID(int=1), "00000000-0000-0000-0000-000000000001"),
+        (_Color.RED, 1),
+        ({1: "a"}, {"1": "a"}),
+    ],
+)
+def test_action_payload_values_parity(orjson_available: bool, value, expected):
+    """The values natively encoded by 'orjson' decode the same without it"""
+    assert json.loads(_serialize_payload({"key": value})) == {"key": expected}
+
+
+def test_query_response_parsing():
+    """The platform query response is parsed into the response items"""
+    raw = (
+        b'{"items":[{"sequence":"my_sequence","topics":['
+        b'{"locator":"my_sequence/topic1/subtopic","timestamp_range":[1000,1001]},'
+        b'{"locator":"my_sequence/topic2/subtopic"}]}]}'
+    )
+    qresp = _DoActionQueryResponse.from_dict(_deserialize_response(raw)).query_response
+
+    assert len(qresp) == 1
+    assert qresp[0].sequence.name == "my_sequence"
+    assert [t.name for t in qresp[0].topics] == ["/topic1/subtopic", "/topic2/subtopic"]
+    assert qresp[0].topics[0].timestamp_range == TimestampRange(start=1000, end=1001)
+    assert qresp[0].topics[1].timestamp_range is None
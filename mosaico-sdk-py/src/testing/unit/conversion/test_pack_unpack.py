@@ -7,6 +7,7 @@ from mosaicolabs.handlers.helpers import (
     _validate_topic_name,
 )
 from mosaicolabs.helpers import pack_topic_resource_name, unpack_topic_full_path
+from mosaicolabs.helpers.helpers import flatten_dict, unflatten_dict
 
 
 def test_pack_topic_resource_name():
@@ -64,3 +65,18 @@ def test_validate_sequence_name(supported_char: str):
     _validate_sequence_name("/my-sequence-name")
     _validate_sequence_name(f"my-sequence{supported_char}name")
     _validate_sequence_name(f"/my-sequence{supported_char}name")
+
+
+def test_flatten_unflatten_dict_roundtrip():
+    nested = {
+        "rate_hz": 100,
+        "enabled": True,
+        "name": "imu_front",
+        "interface": {"type": "UART", "baud": 115200, "opts": {"parity": None}},
+        "bias": [0.1, 0.2],
+    }
+    assert unflatten_dict(flatten_dict(nested)) == nested
+    assert unflatten_dict({"a.b": "1", "a.c.d": "x", "e": "[1, 2]"}) == {
+        "a": {"b": 1, "c": {"d": "x"}},
+        "e": [1, 2],
+    }
@@ -1,5 +1,7 @@
 import pytest
 
+from mosaicolabs import GPS, GPSStatus, Point3d
+from mosaicolabs.helpers.helpers import encode_to_dict
 from mosaicolabs.models import Message
 
 
@@ -11,3 +13,25 @@ def test_message_not_serializable():
         match="Input should be a valid dictionary or instance of Serializable",
     ):
         Message(timestamp_ns=0, data=data)
+
+
+def test_message_encode_matches_generic_encoder():
+    """Test that the per-class encoder tables yield the same columns as the generic encoder"""
+
+    msg = Message(
+        timestamp_ns=10,
+        frame_id="gps_link",
+        data=GPS(
+            position=Point3d(x=1.0, y=2.0, z=3.0),
+            status=GPSStatus(status=1, service=2, satellites=8),
+        ),
+    )
+    expected = {
+        field: encode_to_dict(getattr(msg, field))
+        for field in Message.model_fields
+        if field != "data"
+    }
+    expected.update(
+        {field: encode_to_dict(getattr(msg.data, field)) for field in GPS.model_fields}
+    )
+    assert msg._encode() == expected
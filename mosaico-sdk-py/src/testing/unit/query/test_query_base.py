@@ -2,6 +2,7 @@ from typing import Optional, Type
 
 import pytest
 
+from mosaicolabs import GPS, IMU
 from mosaicolabs.models.query import (
     Query,
     QueryOntologyCatalog,
@@ -183,6 +184,27 @@ def test_construction_query_from_response():
     assert all(t in expected_expr_top_values for t in qtop._expressions[0].value)
     assert all(t in qtop._expressions[0].value for t in expected_expr_top_values)
 
+    # The keys are tracked even if the builders skip the validation
+    with pytest.raises(NotImplementedError):
+        qseq.with_name("seq0")
+    with pytest.raises(NotImplementedError):
+        qtop.with_name("seq0/top00")
+
+    # The '$in' operands are lists, as for any other '$in' expression
+    assert qseq.to_dict() == {"locator": {"$in": ["seq0", "seq1"]}}
+
+    # The conversions reflect the current response items
+    qresp.items.append(
+        QueryResponseItem(
+            sequence=QueryResponseItemSequence(name="seq2"),
+            topics=[QueryResponseItemTopic(name="seq2/top20", timestamp_range=None)],
+        )
+    )
+    assert qresp.to_query_sequence().to_dict() == {
+        "locator": {"$in": ["seq0", "seq1", "seq2"]}
+    }
+    assert "seq2/top20" in qresp.to_query_topic().to_dict()["locator"]["$in"]
+
 
 def test_invalid_construction_query_from_response():
     qresp = QueryResponse(items=[])
@@ -216,6 +238,9 @@ def test_query_base_fails_on_bad_operator_format(query_type: Type[QueryableProto
             query_type().with_expression(
                 qexpr("key", "eq", 0),
             )
+    # Fail on empty operator
+    with pytest.raises(ValueError):
+        query_type._from_expressions(qexpr("key", "", 0))
 
 
 _ALL_TESTING_TYPES = [int, float, str, bool]
@@ -412,3 +437,73 @@ def test_qyeryable_unsupported_no_operators(operator: str):
     field = cls("", _QueryExpression)
     with pytest.raises(AttributeError, match="provides no operators."):
         getattr(field, operator)
+
+
+def test_queryable_field_types_are_shared():
+    """The composite field classes are built once per mixin and shared among models"""
+    assert type(IMU.Q.acceleration.x) is type(GPS.Q.position.x)
+    assert type(IMU.Q.acceleration.x).__name__ == "_QueryableNumericField"
+    assert type(IMU.Q.frame_id) is not type(IMU.Q.acceleration.x)
+
+
+def test_query_proxy_nested_access_is_cached():
+    """Nested proxies are built once and reused on later accesses"""
+    assert IMU.Q.acceleration is IMU.Q.acceleration
+    assert IMU.Q.acceleration.x is IMU.Q.acceleration.x
+    assert IMU.Q.acceleration.x.full_path == "imu.acceleration.x"
+
+
+@pytest.mark.parametrize(
+    "query_type",
+    [QueryTopic, QuerySequence],
+)
+def test_query_to_dict_is_cached_until_next_expression(
+    query_type: Type[QueryableProtocol],
+):
+    """Serialization is reused across calls and refreshed when an expression is added"""
+    query = query_type().with_name("a_name")
+    first = query.to_dict()
+    assert query.to_dict() == first
+    assert query._dict_cache is not None
+
+    # Mutating a returned dictionary does not alter the later serializations
+    first["locator"] = {"$eq": "another_name"}
+    first["extra"] = {}
+    assert query.to_dict() == {"locator": {"$eq": "a_name"}}
+
+    query.with_user_metadata("key", eq=1)
+    assert query.to_dict() == {
+        "locator": {"$eq": "a_name"},
+        "user_metadata": {"key": {"$eq": 1}},
+    }
+
+
+@pytest.mark.parametrize(
+    "query_type",
+    _QUERY_TYPES,
+)
+def test_query_freeze_prevents_new_expressions(query_type: Type[QueryableProtocol]):
+    """A frozen query builder rejects further expressions and keeps its serialization"""
+    qexpr = query_type.__supported_query_expressions__[0]
+    query = query_type._from_expressions(qexpr("tag.key", "$eq", 0)).freeze()
+    serialized = query.to_dict()
+    cached = query._dict_cache
+
+    with pytest.raises(RuntimeError, match="frozen"):
+        query._with_expression(qexpr("tag.other_key", "$eq", 1))
+    with pytest.raises(RuntimeError, match="frozen"):
+        query._unsafe_extend([qexpr("tag.other_key", "$eq", 1)])
+    assert query.to_dict() == serialized
+    assert query._dict_cache is cached
+
+
+def test_query_append_is_atomic():
+    """A failing append does not partially modify the root query"""
+    query = Query(QueryTopic())
+    with pytest.raises(ValueError, match="Duplicate query type"):
+        query.append(QuerySequence(), QueryTopic())
+    assert list(query.to_dict()) == ["topic"]
+
+    # The rejected sequence query can still be appended
+    query.append(QuerySequence())
+    assert list(query.to_dict()) == ["topic", "sequence"]
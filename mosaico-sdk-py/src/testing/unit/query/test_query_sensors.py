@@ -1,6 +1,7 @@
 # ======================================================================
 # 3. UNIT TESTS
 # ======================================================================
+import pyarrow as pa
 import pytest
 
 from mosaicolabs.models.query import (
@@ -542,6 +543,21 @@ class TestQueryTemperatureAPI:
         assert temperature.value == 258.15
         assert temperature.to_fahrenheit() == 5
 
+    def test_array_conversion_helper_methods(self):
+        """
+        Tests the vectorized conversion of Celsius and Fahrenheit values to Kelvin.
+        """
+        kelvin = Temperature.from_celsius_array([10, -273.15, 100])
+        assert kelvin.type == pa.float64()
+        assert kelvin.to_pylist() == pytest.approx([283.15, 0.0, 373.15])
+
+        fahrenheit = [5, -40, 32, 212]
+        kelvin = Temperature.from_fahrenheit_array(fahrenheit)
+        assert kelvin.type == pa.float64()
+        assert kelvin.to_pylist() == pytest.approx(
+            [Temperature.from_fahrenheit(value=f).value for f in fahrenheit]
+        )
+
 
 class TestQueryPressureAPI:
     def test_accessibility(self):
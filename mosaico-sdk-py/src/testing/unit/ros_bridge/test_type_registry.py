@@ -0,0 +1,183 @@
+import os
+
+import pytest
+from rosbags.typesys import Stores
+
+from mosaicolabs.ros_bridge.registry import ROSTypeRegistry
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    ROSTypeRegistry.reset()
+    yield
+    ROSTypeRegistry.reset()
+
+
+def test_get_types_merges_global_and_store_definitions():
+    """Verify that store-specific definitions overlay the global ones."""
+    ROSTypeRegistry.register("custom_msgs/msg/Flag", "bool flag")
+    ROSTypeRegistry.register("custom_msgs/msg/Label", "string label")
+    ROSTypeRegistry.register(
+        "custom_msgs/msg/Flag", "bool flag\nuint8 level", store=Stores.ROS2_HUMBLE
+    )
+
+    assert ROSTypeRegistry.get_types(None) == {
+        "custom_msgs/msg/Flag": "bool flag",
+        "custom_msgs/msg/Label": "string label",
+    }
+    assert ROSTypeRegistry.get_types(Stores.ROS2_HUMBLE) == {
+        "custom_msgs/msg/Flag": "bool flag\nuint8 level",
+        "custom_msgs/msg/Label": "string label",
+    }
+    # A store without specific definitions only sees the global ones
+    assert ROSTypeRegistry.get_types(Stores.ROS1_NOETIC) == ROSTypeRegistry.get_types(
+        None
+    )
+
+
+def test_get_types_is_cached_until_next_registration():
+    """Verify that the merged view is reused, and rebuilt after a registration or a reset."""
+    ROSTypeRegistry.register("custom_msgs/msg/Flag", "bool flag")
+
+    types = ROSTypeRegistry.get_types(Stores.ROS2_HUMBLE)
+    assert ROSTypeRegistry.get_types(Stores.ROS2_HUMBLE) is types
+
+    ROSTypeRegistry.register(
+        "custom_msgs/msg/Label", "string label", store=Stores.ROS2_HUMBLE
+    )
+    new_types = ROSTypeRegistry.get_types(Stores.ROS2_HUMBLE)
+    assert new_types is not types
+    assert "custom_msgs/msg/Label" in new_types
+
+    ROSTypeRegistry.reset()
+    assert ROSTypeRegistry._registry == {}
+    assert not ROSTypeRegistry.get_types(Stores.ROS2_HUMBLE)
+
+
+def test_register_from_file_reads_updated_content(tmp_path):
+    """Verify that a cached .msg file is read again once modified."""
+    msg_file = tmp_path / "Flag.msg"
+    msg_file.write_text("bool flag")
+    ROSTypeRegistry.register("custom_msgs/msg/Flag", msg_file)
+    assert ROSTypeRegistry.get_types(None)["custom_msgs/msg/Flag"] == "bool flag"
+
+    # Rewrite within the same modification time tick
+    stat = msg_file.stat()
+    msg_file.write_text("bool flag\nuint8 level")
+    os.utime(msg_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    ROSTypeRegistry.register("custom_msgs/msg/Flag", msg_file)
+    assert (
+        ROSTypeRegistry.get_types(None)["custom_msgs/msg/Flag"]
+        == "bool flag\nuint8 level"
+    )
+
+    # Replace it with a file of the same size and modification time
+    new_file = tmp_path / "Flag.msg.new"
+    new_file.write_text("bool flag\nint8  level")
+    os.utime(new_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(new_file, msg_file)
+    ROSTypeRegistry.register("custom_msgs/msg/Flag", msg_file)
+    assert (
+        ROSTypeRegistry.get_types(None)["custom_msgs/msg/Flag"]
+        == "bool flag\nint8  level"
+    )
+
+    with pytest.raises(FileNotFoundError):
+        ROSTypeRegistry.register("custom_msgs/msg/Missing", tmp_path / "Missing.msg")
+
+
+def test_register_from_string_source(tmp_path):
+    """Verify that a string source is read as a file only if it is an existing .msg path."""
+    msg_file = tmp_path / "Flag.msg"
+    msg_file.write_text("bool flag")
+
+    ROSTypeRegistry.register("custom_msgs/msg/FromPath", str(msg_file))
+    ROSTypeRegistry.register("custom_msgs/msg/FromText", "string label")
+    ROSTypeRegistry.register("custom_msgs/msg/Missing", str(tmp_path / "Missing.msg"))
+
+    assert ROSTypeRegistry.get_types(None) == {
+        "custom_msgs/msg/FromPath": "bool flag",
+        "custom_msgs/msg/FromText": "string label",
+        "custom_msgs/msg/Missing": str(tmp_path / "Missing.msg"),
+    }
+
+
+def test_register_directory(tmp_path):
+    """Verify that all the .msg files of a directory are registered under the package name."""
+    (tmp_path / "Flag.msg").write_text("bool flag")
+    (tmp_path / "Label.msg").write_text("string label")
+    (tmp_path / "README.md").write_text("not a message")
+    (tmp_path / "nested.msg").mkdir()
+
+    ROSTypeRegistry.register_directory(
+        "custom_msgs", tmp_path, store=Stores.ROS2_HUMBLE
+    )
+
+    assert ROSTypeRegistry.get_types(Stores.ROS2_HUMBLE) == {
+        "custom_msgs/msg/Flag": "bool flag",
+        "custom_msgs/msg/Label": "string label",
+    }
+    assert not ROSTypeRegistry.get_types(None)
+
+    with pytest.raises(ValueError):
+        ROSTypeRegistry.register_directory("custom_msgs", tmp_path / "Flag.msg")
+
+
+def test_get_types_is_read_only():
+    """Verify that the shared merged view cannot be mutated by the callers."""
+    ROSTypeRegistry.register("custom_msgs/msg/Flag", "bool flag")
+
+    types = ROSTypeRegistry.get_types(None)
+    with pytest.raises(TypeError):
+        types["custom_msgs/msg/Label"] = "string label"  # type: ignore[index]
+
+    assert "custom_msgs/msg/Label" not in ROSTypeRegistry.get_types(None)
+
+
+def test_get_types_does_not_create_scopes():
+    """Verify that reading the merged views leaves the registry storage untouched."""
+    assert not ROSTypeRegistry.get_types(None)
+    assert not ROSTypeRegistry.get_types(Stores.ROS2_HUMBLE)
+
+    assert not ROSTypeRegistry._registry
+
+
+def test_identical_definitions_are_shared(tmp_path):
+    """Verify that the same definition registered in several scopes is stored once."""
+    ROSTypeRegistry.register("custom_msgs/msg/Flag", "".join(["bool ", "flag"]))
+    ROSTypeRegistry.register(
+        "custom_msgs/msg/Flag", "".join(["bool ", "flag"]), store=Stores.ROS2_HUMBLE
+    )
+    (tmp_path / "Flag.msg").write_text("bool flag")
+    ROSTypeRegistry.register_directory(
+        "custom_msgs", tmp_path, store=Stores.ROS1_NOETIC
+    )
+
+    definitions = [
+        ROSTypeRegistry.get_types(store)["custom_msgs/msg/Flag"]
+        for store in (None, Stores.ROS2_HUMBLE, Stores.ROS1_NOETIC)
+    ]
+    assert all(d is definitions[0] for d in definitions)
+
+
+def test_replaced_definitions_are_evicted():
+    """Verify that a definition is dropped once no registered type uses it."""
+    ROSTypeRegistry.register("custom_msgs/msg/Flag", "bool flag")
+    ROSTypeRegistry.register(
+        "custom_msgs/msg/Flag", "bool flag", store=Stores.ROS2_HUMBLE
+    )
+
+    # Still used by the ROS2_HUMBLE scope
+    ROSTypeRegistry.register("custom_msgs/msg/Flag", "bool flag\nuint8 level")
+    assert "bool flag" in ROSTypeRegistry._canonical_defs
+
+    ROSTypeRegistry.register(
+        "custom_msgs/msg/Flag", "bool flag\nuint8 level", store=Stores.ROS2_HUMBLE
+    )
+    assert ROSTypeRegistry._canonical_defs == {
+        "bool flag\nuint8 level": "bool flag\nuint8 level"
+    }
+
+    # Registering the same definition again keeps it
+    ROSTypeRegistry.register("custom_msgs/msg/Flag", "bool flag\nuint8 level")
+    assert "bool flag\nuint8 level" in ROSTypeRegistry._canonical_defs